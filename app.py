@@ -1,22 +1,39 @@
 import asyncio
+import logging
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from cli import get_latest_forex_data, get_latest_forex_events
+from core.config import get_cfg
 
-scheduler = BackgroundScheduler()
+logger: logging.Logger = logging.getLogger("app_logger")
+scheduler = AsyncIOScheduler()
 trigger = IntervalTrigger(minutes=10)
 
 
+async def run_scheduler() -> None:
+    """
+    Start the scheduler on the running event loop and keep the loop alive, so the jobs share it.
+
+    """
+    scheduler.start()
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        scheduler.shutdown()
+
+
 if __name__ == "__main__":
-    scheduler.add_job(lambda: asyncio.run(get_latest_forex_data()), trigger, max_instances=1, replace_existing=True)
+    get_cfg()  # the first call configures logging
+    # CLI commands are wrapped by async_command, schedule their logged coroutines on the scheduler loop
+    scheduler.add_job(get_latest_forex_data.coroutine, trigger, max_instances=1, replace_existing=True)
     scheduler.add_job(
-        lambda: asyncio.run(get_latest_forex_events(gui=False)), trigger, max_instances=1, replace_existing=True
+        get_latest_forex_events.coroutine, trigger, kwargs={"gui": False}, max_instances=1, replace_existing=True
     )
-    scheduler.start()
+
     try:
-        while True:
-            ...
-    except:
-        scheduler.shutdown()
+        asyncio.run(run_scheduler())
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Scheduler stopped.")
@@ -11,21 +11,36 @@ from functools import wraps
 from typing import Callable, Optional
 
 from fmp.repository.models import ForexPair
-from fmp.repository.mongo import ForexDataRepository, ForexEconomicEventsRepository
 from typer import Option, Typer
 
 from core import DefaultEconomicEventsClient, DefaultForexDataClient
 from core.components.economic_events.crawler import EconomicEventsCrawler
+from core.components.economic_events.repository import EconomicEventsRepository
 from core.components.forex_data.client import ForexDataCSVClient
+from core.components.forex_data.repository import ForexDataRepository
+from core.components.scrapper import browser_pool
+from core.config import get_cfg
+
+try:
+    import uvloop
+except ImportError:  # not available on every platform, e.g. Windows
+    uvloop = None
 
 cli = Typer(pretty_exceptions_enable=False)
 logger: logging.Logger = logging.getLogger("cli_logger")
 
+if uvloop is not None:  # applies to every loop created by asyncio.run, app.py scheduler included
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 def async_command(func: Callable) -> Callable:
     """
     Decorator to run a command asynchronously.
 
+    The idle pooled browsers are quit when the command ends.
+    The logged and timed coroutine is also exposed as the `coroutine` attribute of the decorated function,
+    for callers already running an event loop, like the app.py scheduler.
+
     Parameters
     ----------
     func : Callable
@@ -38,25 +53,50 @@ def async_command(func: Callable) -> Callable:
     """
 
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        func_id, func_name = id(func), func.__name__
-        func_desc = f"{func_name}[id:{func_id}]"
-        start_time = time.time()
+    async def coroutine(*args, **kwargs):
+        get_cfg()  # the first call configures logging
+        start_time = time.perf_counter()
 
-        logger.info(f"Running command {func_desc}.")
+        # %-style arguments, formatted only if the record is emitted
+        logger.info("Running command %s[id:%d].", func.__name__, id(func))
 
         try:
-            asyncio.run(func(*args, **kwargs))
+            await func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error during command {func_desc}: {e}")
+            logger.error("Error during command %s[id:%d]: %s", func.__name__, id(func), e)
             raise e
         else:
-            duration = time.time() - start_time
-            logger.info(f"Command {func_desc} completed successfully in {duration:.2f} seconds.")
+            duration = time.perf_counter() - start_time
+            logger.info("Command %s[id:%d] completed successfully in %.2f seconds.", func.__name__, id(func), duration)
+        finally:
+            # don't keep idle browsers between the scheduled runs, quitting them blocks so it runs in a thread
+            await asyncio.to_thread(browser_pool.close)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        asyncio.run(coroutine(*args, **kwargs))
 
+    wrapper.coroutine = coroutine
     return wrapper
 
 
+def forex_data_client_for_all_tickers() -> DefaultForexDataClient:
+    """
+    Create the default forex data client set up for all the predefined tickers.
+
+    All the tickers are downloaded together, within a single batched request.
+
+    Returns
+    -------
+    DefaultForexDataClient
+        Forex data client ready for the update.
+    """
+    forex_data_client = DefaultForexDataClient(ForexDataRepository)
+    tickers: list[ForexPair] = forex_data_client.tickers
+    forex_data_client.for_multiple_tickers(tickers)
+    return forex_data_client
+
+
 @cli.command(name="update-historical-forex-data")
 @async_command
 async def get_historical_forex_data() -> None:
@@ -65,9 +105,7 @@ async def get_historical_forex_data() -> None:
 
     This function initializes the forex data client, sets the tickers, and updates the historical data.
     """
-    forex_data_client = DefaultForexDataClient(ForexDataRepository)
-    tickers = forex_data_client.tickers
-    forex_data_client.for_multiple_tickers(tickers)
+    forex_data_client = forex_data_client_for_all_tickers()
     await forex_data_client.update_historical()
 
 
@@ -79,9 +117,7 @@ async def get_latest_forex_data() -> None:
 
     This function initializes the forex data client, sets the tickers, and updates the latest data.
     """
-    forex_data_client = DefaultForexDataClient(ForexDataRepository)
-    tickers: list[ForexPair] = forex_data_client.tickers
-    forex_data_client.for_multiple_tickers(tickers)
+    forex_data_client = forex_data_client_for_all_tickers()
     await forex_data_client.update_latest()
 
 
@@ -108,7 +144,7 @@ async def get_historical_forex_events(
     end_date: Optional[date] = datetime.strptime(end_date_str, "%d-%m-%Y").date() if end_date_str else None
 
     economic_events_client = DefaultEconomicEventsClient(
-        crawler=EconomicEventsCrawler, repository=ForexEconomicEventsRepository
+        crawler=EconomicEventsCrawler, repository=EconomicEventsRepository
     )
     date_ranges = economic_events_client.create_date_ranges(start_date, end_date)
     await economic_events_client.update_for_dates(date_ranges, shuffle_dates=True, gui=gui)
@@ -126,7 +162,7 @@ async def get_latest_forex_events(gui: bool = Option(False, "--gui", "-g")) -> N
         Whether to use the GUI by scrapper, by default False.
     """
     economic_events_client = DefaultEconomicEventsClient(
-        crawler=EconomicEventsCrawler, repository=ForexEconomicEventsRepository
+        crawler=EconomicEventsCrawler, repository=EconomicEventsRepository
     )
     await economic_events_client.update_recent_events(gui=gui)
 
@@ -1,8 +1,74 @@
-from typing import Type
+import asyncio
+from typing import Awaitable, Callable, ClassVar, Optional, Type, TypeVar
 
 from fmp.repository.mongo import MongoDBRepository
 
+T = TypeVar("T")
+
+# Chunked writes of all the clients follow one convention, see FMPClient._write_chunks: at most WRITE_CONCURRENCY
+# chunks are in flight, so a large write doesn't saturate the driver connection pool, and every chunk is finished
+# before an error is re-raised. A chunk writer able to account for its failures returns them instead of raising.
+WRITE_CONCURRENCY = 4
+
 
 class FMPClient:
+    _indexes_ensured: ClassVar[set[Type[MongoDBRepository]]] = set()  # repositories with indexes ensured in the process
+
     def __init__(self, repository: Type[MongoDBRepository]) -> None:
         self._repository: MongoDBRepository = repository()
+        self._indexes_lock: Optional[asyncio.Lock] = None
+
+    async def _ensure_indexes(self) -> None:
+        """
+        Ensure the repository indexes once per process, the clients using the same repository share the result.
+
+        """
+        repository_class = type(self._repository)
+
+        if repository_class in FMPClient._indexes_ensured:
+            return
+
+        if self._indexes_lock is None:  # created lazily, inside the running event loop
+            self._indexes_lock = asyncio.Lock()
+
+        async with self._indexes_lock:
+            if repository_class not in FMPClient._indexes_ensured:
+                await self._repository.ensure_indexes()
+                FMPClient._indexes_ensured.add(repository_class)
+
+    @staticmethod
+    async def _write_chunks(write: Callable[[list], Awaitable[T]], items: list, chunk_size: int) -> list[T]:
+        """
+        Write the items in chunks, concurrently, following the convention described at WRITE_CONCURRENCY.
+
+        Parameters
+        ----------
+        write : Callable[[list], Awaitable[T]]
+            Coroutine function writing a single chunk.
+        items : list
+            Documents or operations to write.
+        chunk_size : int
+            Maximum number of items in a chunk.
+
+        Returns
+        -------
+        list[T]
+            Results of the chunk writes, in the chunks order.
+
+        """
+        semaphore = asyncio.Semaphore(WRITE_CONCURRENCY)
+
+        async def write_chunk(chunk: list) -> T:
+            async with semaphore:
+                return await write(chunk)
+
+        results = await asyncio.gather(
+            *[write_chunk(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)],
+            return_exceptions=True,
+        )
+
+        for result in results:  # raise only once all the chunks are done
+            if isinstance(result, Exception):
+                raise result
+
+        return results
@@ -1,19 +1,24 @@
+import asyncio
 import logging
 import random
-import time
 from datetime import datetime, timedelta
 from typing import Type
 
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 from core.components.client import FMPClient
 from core.components.economic_events.crawler import EconomicEventsCrawler
 from core.components.economic_events.models import EventList
 from core.components.economic_events.scrapper import DEFAULT_SCRAPPER_CLASS
-from core.config import cfg
+from core.config import get_cfg
 
 logger = logging.getLogger("economic_events_logger")
 
 __all__ = ["DefaultEconomicEventsClient"]
 
+BULK_WRITE_CHUNK_SIZE = 1000
+
 
 class EconomicEventsClient(FMPClient):
     def __init__(self, crawler: Type[EconomicEventsCrawler], scrapper=DEFAULT_SCRAPPER_CLASS, *args, **kwargs):
@@ -22,62 +27,96 @@ class EconomicEventsClient(FMPClient):
         self._scrapper_class = scrapper
 
     async def upsert_events(self, events: EventList) -> tuple[int, int, int]:
-        await self._repository.ensure_indexes()
-        inserted = updated = error = 0
-        for event in events:
-            try:
-                res = await self._repository.update_one(
-                    {"title": event.title, "timestamp": event.timestamp, "subject.name": event.subject.name},
-                    event.model_dump(),
-                    upsert=True,
-                )
-            except Exception as e:
-                logger.error(f"Error while upserting event: {e}")
-                error += 1
-            else:
-                if res.upserted_id is not None:
-                    inserted += 1
-                elif res.modified_count > 0:
-                    updated += 1
+        await self._ensure_indexes()
+        documents: dict[tuple, dict] = {}  # keyed like the unique index, the last duplicate in the batch wins
+
+        for document in events.model_dump():  # one serializer call for the whole list
+            documents[(document["title"], document["timestamp"], document["subject"]["name"])] = document
+
+        operations = [
+            UpdateOne(
+                {"title": title, "timestamp": timestamp, "subject.name": subject_name},
+                {"$set": document},
+                upsert=True,
+            )
+            for (title, timestamp, subject_name), document in documents.items()
+        ]
+
+        counts = await self._write_chunks(self._bulk_write_chunk, operations, BULK_WRITE_CHUNK_SIZE)
+
+        inserted, updated, error = (sum(column) for column in zip(*counts)) if counts else (0, 0, 0)
         return inserted, updated, error
 
+    async def _bulk_write_chunk(self, operations: list[UpdateOne]) -> tuple[int, int, int]:
+        """
+        Send a chunk of upserts. The write errors are counted, not raised, so the crawling goes on.
+
+        Parameters
+        ----------
+        operations : list[UpdateOne]
+            Upsert operations.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            Number of inserted, updated and failed events, the whole chunk is counted as failed if it was not written.
+
+        """
+        try:
+            res = await self._repository.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            logger.error(f"Error while upserting events: {e}")
+            return (
+                e.details.get("nUpserted", 0),
+                e.details.get("nModified", 0),
+                len(e.details.get("writeErrors", [])),
+            )
+        except Exception as e:  # counted like the write errors, the crawling goes on with the next chunks
+            logger.error(f"Error while upserting events: {e}")
+            return 0, 0, len(operations)
+
+        return res.upserted_count, res.modified_count, 0
+
     async def update_for_dates(
         self, date_ranges: list[tuple[datetime.date, datetime.date]], shuffle_dates: bool = True, gui: bool = False
     ):
         if shuffle_dates:
             random.shuffle(date_ranges)
 
-        crawler = self._crawler_class(self._scrapper_class, date_ranges, gui=gui)
-
-        while not crawler.iteration_done:
-            events_list: list[EventList] = crawler.crawl()
-            inserted = updated = error = 0
+        with self._crawler_class(date_ranges=date_ranges, scrapper_class=self._scrapper_class, gui=gui) as crawler:
+            while not crawler.iteration_done:
+                events_list: list[EventList] = await crawler.crawl()
+                inserted = updated = error = 0
 
-            for events in events_list:
-                i, u, e = await self.upsert_events(events)
-                inserted += i
-                updated += u
-                error += e
+                for events in events_list:
+                    i, u, e = await self.upsert_events(events)
+                    inserted += i
+                    updated += u
+                    error += e
 
-            logger.info(f"New events: {inserted}, Updated events: {updated}, Errors: {error}")
-            wait_for = random.randint(2, 8)
-            logger.info(f"Done: {crawler.percentage_done * 100:.2f}%")
+                logger.info(f"New events: {inserted}, Updated events: {updated}, Errors: {error}")
+                wait_for = random.randint(2, 8)
+                logger.info(f"Done: {crawler.percentage_done * 100:.2f}%")
 
-            if crawler.iteration_done:
-                break
+                if crawler.iteration_done:
+                    break
 
-            logger.info(f"Waiting for {wait_for} seconds before summoning fresh scrapper.")
-            time.sleep(wait_for)
+                logger.info(f"Waiting for {wait_for} seconds before crawling next dates.")
+                await asyncio.sleep(wait_for)
 
     async def update_recent_events(self, gui: bool = False):
+        # the browser session blocks, it runs in a worker thread so the other scheduled jobs keep the event loop
+        events_list: EventList = await asyncio.to_thread(self._scrape_recent_events, gui)
+        inserted, updated, error = await self.upsert_events(events_list)
+        logger.info(f"New events: {inserted}, Updated events: {updated}, Errors: {error}")
+
+    def _scrape_recent_events(self, gui: bool) -> EventList:
         with self._scrapper_class(gui=gui, recent_only=True) as scrapper:
             scrapper.setup()
             logger.info("Getting recent economic events.")
             data = scrapper.get_data()
             logger.info(f"Received {len(data)} events for today and future days.")
-            events_list: EventList = scrapper.parse_objects(data)
-            inserted, updated, error = await self.upsert_events(events_list)
-            logger.info(f"New events: {inserted}, Updated events: {updated}, Errors: {error}")
+            return scrapper.parse_objects(data)
 
     async def get_present_dates(self) -> list[datetime.date]:
         return await self._repository.get_present_dates()
@@ -102,7 +141,7 @@ class EconomicEventsClient(FMPClient):
             List of date ranges.
 
         """
-        today = datetime.now(tz=cfg.timezone).date()
+        today = datetime.now(tz=get_cfg().timezone).date()
 
         if start_date is None:
             start_date = today - timedelta(weeks=5 * 52)  # 5 years ago
@@ -110,13 +149,9 @@ class EconomicEventsClient(FMPClient):
         if end_date is None:
             end_date = today
 
-        date_pairs = []
-
-        while start_date < end_date:
-            date_pairs.append((start_date, start_date + timedelta(days=6)))
-            start_date += timedelta(weeks=1)
-
-        return date_pairs
+        weeks = max(0, -(-(end_date - start_date).days // 7))  # weeks starting before end_date
+        week, six_days = timedelta(weeks=1), timedelta(days=6)
+        return [(start_date + i * week, start_date + i * week + six_days) for i in range(weeks)]
 
 
 DefaultEconomicEventsClient = EconomicEventsClient
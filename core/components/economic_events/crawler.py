@@ -1,38 +1,84 @@
+import asyncio
 import logging
 import random
+import sys
 import time
 from datetime import datetime
+from typing import Optional
 
 from core.components.crawler import BaseCrawler
 from core.components.economic_events.models import EventList
+from core.components.scrapper import BaseScrapper
 
 logger = logging.getLogger("economic_events_logger")
 
 
 class EconomicEventsCrawler(BaseCrawler):
-    def __init__(self, date_ranges: list[tuple[datetime.date, datetime.date]] = None, *args, **kwargs):
+    def __init__(
+        self, date_ranges: list[tuple[datetime.date, datetime.date]] = None, *args, max_workers: int = 3, **kwargs
+    ):
         super().__init__(*args, **kwargs)
+        self._max_workers = max_workers
+        self._scrappers: list[Optional[BaseScrapper]] = [None] * max_workers  # kept alive between crawl() calls
 
         if date_ranges:
-            self._date_ranges: list[tuple[datetime.date, datetime.date]] = date_ranges
+            self._date_ranges: list[tuple[datetime.date, datetime.date]] = list(date_ranges)  # consumed in place
             self._original_dates_count = len(date_ranges)
 
-    def crawl(self, *args, **kwargs) -> list[EventList]:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down all the scrappers kept alive by the crawler.
+
+        """
+        for worker in range(len(self._scrappers)):
+            self._close_scrapper(worker)
+
+    def _get_scrapper(self, worker: int) -> BaseScrapper:
+        """
+        Get the scrapper owned by the worker, start a new one if there is none yet.
+
+        Parameters
+        ----------
+        worker : int
+            Worker index.
+
+        Returns
+        -------
+        BaseScrapper
+            Ready to use scrapper.
+
+        """
+        if self._scrappers[worker] is None:
+            self._scrappers[worker] = self._scrapper_class(gui=self._gui).__enter__()
+
+        return self._scrappers[worker]
+
+    def _close_scrapper(self, worker: int, *exc_info) -> None:
+        if scrapper := self._scrappers[worker]:
+            self._scrappers[worker] = None
+            scrapper.__exit__(*(exc_info or (None, None, None)))
+
+    async def crawl(self, *args, **kwargs) -> list[EventList]:
         dates_q = random.randint(2, 5)
         self._attempt = 0
 
         if len(self._date_ranges) <= 5:
-            dates_to_crawl = self._date_ranges
-            self._remove_dates(self._date_ranges)
+            dates_to_crawl, self._date_ranges = self._date_ranges, []
         else:
             dates_to_crawl = self._cut_original_date_ranges(dates_q)
 
-        return self._safe_crawl(dates_to_crawl)
+        return await self._safe_crawl(dates_to_crawl)
 
-    def _safe_crawl(self, dates_to_crawl: list[tuple[datetime.date, datetime.date]]) -> list[EventList]:
+    async def _safe_crawl(self, dates_to_crawl: list[tuple[datetime.date, datetime.date]]) -> list[EventList]:
         while self._attempt < self._max_retries_on_error:
             try:
-                return self._start_crawling(dates_to_crawl)
+                return await self._start_crawling(dates_to_crawl)
             except Exception as e:
                 self._attempt += 1
                 logger.error(f"Error during crawling attempt {self._attempt}: {e}")
@@ -40,17 +86,47 @@ class EconomicEventsCrawler(BaseCrawler):
                     logger.info(
                         f"Retrying in 20 seconds... (Attempt {self._attempt + 1} of {self._max_retries_on_error})"
                     )
-                    time.sleep(20)
+                    await asyncio.sleep(20)
                 else:
                     logger.error("Max retries reached. Exiting.")
                     raise e
 
-    def _start_crawling(self, dates_to_crawl: list[tuple[datetime.date, datetime.date]]) -> list[EventList]:
-        stored_events: [list[EventList]] = []
+    async def _start_crawling(self, dates_to_crawl: list[tuple[datetime.date, datetime.date]]) -> list[EventList]:
+        """
+        Crawl the date ranges concurrently, using up to max_workers scrappers running in separate threads.
+        Date ranges are split round-robin between the workers, each worker reuses its own scrapper
+        across all crawl() calls.
 
-        with self._scrapper_class(gui=self._gui) as scrapper:
-            logger.info(f"Getting economic events for {dates_to_crawl}.")
+        Parameters
+        ----------
+        dates_to_crawl : list[tuple[datetime.date, datetime.date]]
+            List of date ranges.
+
+        Returns
+        -------
+        list[EventList]
+            List of economic events lists.
+
+        """
+        workers = min(self._max_workers, len(dates_to_crawl))
+        shards = [dates_to_crawl[i::workers] for i in range(workers)]
+        results = await asyncio.gather(
+            *[asyncio.to_thread(self._crawl_shard, worker, shard) for worker, shard in enumerate(shards)],
+            return_exceptions=True,
+        )
+
+        for result in results:  # raise only once all the workers are done
+            if isinstance(result, Exception):
+                raise result
+
+        return [events for shard_events in results for events in shard_events]
+
+    def _crawl_shard(self, worker: int, dates_to_crawl: list[tuple[datetime.date, datetime.date]]) -> list[EventList]:
+        stored_events: list[EventList] = []
+        scrapper = self._get_scrapper(worker)
+        logger.info(f"Getting economic events for {dates_to_crawl}.")
 
+        try:
             for date_range in dates_to_crawl:
                 scrapper.setup(from_date=date_range[0], to_date=date_range[1])
                 data = scrapper.get_data()
@@ -61,8 +137,11 @@ class EconomicEventsCrawler(BaseCrawler):
                 wait_for = random.randint(1, 3)
                 logger.info(f"Waiting for {wait_for} seconds between changing dates.")
                 time.sleep(wait_for)
+        except Exception:
+            self._close_scrapper(worker, *sys.exc_info())  # browser state is unknown, a fresh one is started on retry
+            raise
 
-            return stored_events
+        return stored_events
 
     def _cut_original_date_ranges(self, dates_to_cut: int) -> list[tuple[datetime.date, datetime.date]]:
         """
@@ -80,25 +159,11 @@ class EconomicEventsCrawler(BaseCrawler):
             List of date ranges.
 
         """
-        dates = random.sample(self._date_ranges, dates_to_cut)
-        self._remove_dates(dates)
+        indexes = sorted(random.sample(range(len(self._date_ranges)), dates_to_cut), reverse=True)
+        dates = [self._date_ranges.pop(i) for i in indexes]  # popping from the end keeps lower indexes valid
+        dates.reverse()
         return dates
 
-    def _remove_dates(self, dates: list[tuple[datetime.date, datetime.date]]) -> None:
-        """
-        Remove the given dates from the original list.
-
-        Parameters
-        ----------
-        dates : list[tuple[datetime.date, datetime.date]]
-            List of date ranges.
-
-        """
-        if dates == self._date_ranges:
-            self._date_ranges = []
-
-        self._date_ranges = [date for date in self._date_ranges if date not in dates]
-
     @property
     def iteration_done(self) -> bool:
         return len(self._date_ranges) == 0
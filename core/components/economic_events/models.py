@@ -1,9 +1,37 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Iterator, Optional
 
-from pydantic import AwareDatetime, BaseModel, Field, model_validator
+from fmp.repository.models import ListBaseModel
+from pydantic import AwareDatetime, BaseModel, Field
 from pydantic.dataclasses import dataclass
 
-from fmp.repository.models import ListBaseModel
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def _now() -> datetime:
+    return _batch_now.get() or datetime.now()
+
+
+@contextmanager
+def batch_timestamps() -> Iterator[datetime]:
+    """
+    Share a single creation/update timestamp between all the events validated inside the block.
+
+    Yields
+    ------
+    datetime
+        Timestamp used for the batch.
+
+    """
+    now = datetime.now()
+    token = _batch_now.set(now)
+
+    try:
+        yield now
+    finally:
+        _batch_now.reset(token)
 
 
 @dataclass
@@ -21,14 +49,8 @@ class Event(BaseModel, validate_assignment=True, use_enum_values=True):
     consensus: str
     forecast: str
     sentiment: int = Field(ge=0, le=1)  # -1: negative, 1: positive, 0: possible error
-    created_at: datetime = datetime.now()  # no need for utc
-    updated_at: datetime = datetime.now()  # no need for utc
-
-    @model_validator(mode="before")
-    def updated_at_signal(self) -> "Event":
-        """Change updated_at value on each model change."""
-        self["updated_at"] = datetime.now()
-        return self
+    created_at: datetime = Field(default_factory=_now)  # no need for utc
+    updated_at: datetime = Field(default_factory=_now)  # no need for utc
 
 
 class EventList(ListBaseModel):
@@ -0,0 +1,40 @@
+import logging
+
+from fmp.repository.mongo import ForexEconomicEventsRepository
+from fmp.repository.utils import log_repo_action
+from pymongo import results
+
+logger: logging.Logger = logging.getLogger("db_logger")
+
+__all__ = ["EconomicEventsRepository"]
+
+
+class EconomicEventsRepository(ForexEconomicEventsRepository):
+    """
+    MongoDB repository class for economic events, extended with bulk operations.
+
+    Attributes
+    ----------
+    __collection_name : Optional[str]
+        Name of the collection associated with the repository.
+
+    """
+
+    __collection_name = "economic_events"  # name-mangled, must be redefined in each subclass
+
+    @log_repo_action(logger)
+    async def bulk_write(self, requests: list, *args, **kwargs) -> results.BulkWriteResult:
+        """
+        Send a batch of write operations to the collection in a single call.
+
+        Parameters
+        ----------
+        requests : list
+            List of pymongo write operations (UpdateOne, InsertOne, ...).
+
+        Returns
+        -------
+        BulkWriteResult
+            Bulk write result object.
+        """
+        return await self._collection.bulk_write(requests, *args, **kwargs)
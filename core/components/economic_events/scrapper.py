@@ -1,33 +1,99 @@
 import logging
-import random
+import sys
 from collections import Counter
 from datetime import datetime, time
+from typing import Any, Callable
 
 from fmp.consts import Country
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from core.components.economic_events.errors import (
     DifferentDatesException,
     DifferentSubjectException,
     DifferentTimezoneException,
 )
-from core.components.economic_events.models import CountrySubject, EventList
+from core.components.economic_events.models import CountrySubject, EventList, batch_timestamps
 from core.components.errors import ScrapperNotPreparedException
 from core.components.scrapper import BaseScrapper
 from core.components.utils import wait_random
-from core.config import cfg
+from core.config import get_cfg
 
 logger = logging.getLogger("scrapper_logger")
 
 
-subjects_names = Country.get_subject_names()
+subjects_names = tuple(Country.get_subject_names())
+subjects_names_count = Counter(subjects_names)  # compared against the page filters on every setup
+# Country cell title -> subject, built once instead of constructing the enum and the model for every row
+SUBJECTS_BY_TITLE: dict[str, CountrySubject] = {
+    country.value: CountrySubject(name=country.value, currency=country.currency) for country in Country
+}
+
+FILTERS_WAIT_TIMEOUT = 5  # seconds, same as the driver's implicit wait
+
+COUNTRIES_TOGGLE_SELECTOR = 'button.btn-calendar[type="button"][onclick="toggleMainCountrySelection();"]'
+
+# Clicks the country links named in arguments[0], in random order, in a single driver call
+SELECT_COUNTRIES_SCRIPT = """
+const names = new Set(arguments[0]);
+const links = [];
+
+for (const link of document.querySelectorAll('a[noref=""]')) {
+    const name = link.textContent.trim();
+    if (names.delete(name)) {  // the first link matching each name only
+        links.push(link);
+    }
+}
+
+for (let i = links.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [links[i], links[j]] = [links[j], links[i]];
+}
+
+links.forEach((link) => link.click());
+"""
+
+# Walks the calendar in a single driver call and returns only the cells used, rows in document order as
+# ["header", date] or ["data", time, country, title, actual, previous, consensus, forecast, sentiment class].
+# Rows of countries other than the ones in arguments[1] are skipped in the browser.
+EVENTS_TABLE_SCRIPT = """
+const dataRows = new Set(arguments[0].querySelectorAll("tr[data-url]"));
+const countries = new Set(arguments[1]);
+const text = (cell) => cell.innerText.trim();
+const rows = [];
+
+for (const row of document.querySelectorAll("tr")) {
+    if (dataRows.has(row)) {
+        const cells = row.querySelectorAll("td");
+        if (countries.has(cells[3].title)) {
+            rows.push([
+                "data",
+                text(cells[0]),
+                cells[3].title,
+                text(cells[4]),
+                text(cells[5]),
+                text(cells[6]),
+                text(cells[7]),
+                text(cells[8]),
+                cells[6].getAttribute("class") || "",
+            ]);
+        }
+    } else if (row.parentElement.matches("thead") && row.parentElement.getAttribute("class") === "table-header") {
+        rows.push(["header", text(row.querySelector("th"))]);
+    }
+}
+
+return rows;
+"""
 
 
 class EconomicEventsScrapperV1(BaseScrapper):
-    source_url: str = str(cfg.fmp.events_source_url)
+    @property
+    def source_url(self) -> str:
+        return str(get_cfg().fmp.events_source_url)
 
     def __init__(self, recent_only: bool = False, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -69,6 +135,23 @@ class EconomicEventsScrapperV1(BaseScrapper):
 
         self._validate_current_filters()
 
+    def _wait_until(self, condition: Callable[[WebDriver], Any]) -> Any:
+        """
+        Wait for the condition, polling frequently so the scrapper moves on as soon as the page is ready.
+
+        Parameters
+        ----------
+        condition : Callable[[WebDriver], Any]
+            Expected condition, like the ones from selenium.webdriver.support.expected_conditions.
+
+        Returns
+        -------
+        Any
+            Value returned by the condition, usually the element.
+
+        """
+        return WebDriverWait(self._driver, FILTERS_WAIT_TIMEOUT, poll_frequency=0.02).until(condition)
+
     def _define_sentiment(self, cell: WebElement) -> int:
         """
         Define the sentiment of the event.
@@ -101,43 +184,34 @@ class EconomicEventsScrapperV1(BaseScrapper):
 
         events: list[dict] = []
         date_cursor: datetime.date = self._date_from
+        timezone = get_cfg().timezone
 
-        table: WebElement = self._driver.find_element(By.XPATH, "//*[@id='calendar']")
-        rows: list[WebElement] = table.find_elements(By.XPATH, "//tr")
-        header_rows: list[WebElement] = table.find_elements(By.XPATH, "//thead[@class='table-header']")
-        data_rows: list[WebElement] = table.find_elements(By.XPATH, ".//tr[@data-url]")
+        table: WebElement = self._driver.find_element(By.ID, "calendar")
+        rows: list[list[str]] = self._driver.execute_script(EVENTS_TABLE_SCRIPT, table, list(SUBJECTS_BY_TITLE))
 
         for row in rows:
-            if row in data_rows:
-                data_cells: list[WebElement] = row.find_elements(By.TAG_NAME, "td")
+            if row[0] == "data":
+                _, time_raw, country, title, actual, previous, consensus, forecast, sentiment_class = row
 
-                if time_raw := data_cells[0].text:
+                if time_raw:
                     cell_time: datetime.time = datetime.strptime(time_raw, "%I:%M %p").time()
                 else:
                     cell_time: datetime.time = time(0, 0)
 
-                try:
-                    country = Country(data_cells[3].get_property("title"))
-                except ValueError:  # Somehow there's a country that does not interest us
-                    continue
-
-                sentiment_cell_info = data_cells[6].get_attribute("class")
-                sentiment = 1 if "positive" in sentiment_cell_info else 0
-
                 data = {
-                    "timestamp": datetime.combine(date_cursor, cell_time, cfg.timezone),
-                    "subject": CountrySubject(name=country.value, currency=country.currency),
-                    "title": data_cells[4].text,
-                    "actual": data_cells[5].text,
-                    "previous": data_cells[6].text,
-                    "consensus": data_cells[7].text,
-                    "forecast": data_cells[8].text,
-                    "sentiment": sentiment,
+                    "timestamp": datetime.combine(date_cursor, cell_time, timezone),
+                    "subject": SUBJECTS_BY_TITLE[country],
+                    "title": sys.intern(title),  # titles repeat week after week, share one string per title
+                    "actual": actual,
+                    "previous": previous,
+                    "consensus": consensus,
+                    "forecast": forecast,
+                    "sentiment": 1 if "positive" in sentiment_class else 0,
                 }
                 events.append(data)
 
-            elif row.find_element(By.XPATH, "..") in header_rows:
-                thead_date: str = row.find_element(By.TAG_NAME, "th").text  # like 'Friday January 01 2021'
+            else:
+                thead_date: str = row[1]  # like 'Friday January 01 2021'
                 date_cursor: datetime.date = datetime.strptime(thead_date, "%A %B %d %Y").date()
 
         return events
@@ -158,7 +232,8 @@ class EconomicEventsScrapperV1(BaseScrapper):
             List of economic events.
 
         """
-        return EventList.model_validate(data)
+        with batch_timestamps():  # one clock read for the whole list
+            return EventList.model_validate(data)
 
     @property
     def current_timezone_filter(self) -> str:
@@ -184,8 +259,8 @@ class EconomicEventsScrapperV1(BaseScrapper):
             Start and end date values
 
         """
-        start_date_input = self._driver.find_element(By.XPATH, "//input[@id='startDate']")
-        end_date_input = self._driver.find_element(By.XPATH, "//input[@id='endDate']")
+        start_date_input = self._driver.find_element(By.ID, "startDate")
+        end_date_input = self._driver.find_element(By.ID, "endDate")
         return start_date_input.get_attribute("value"), end_date_input.get_attribute("value")
 
     @property
@@ -199,19 +274,11 @@ class EconomicEventsScrapperV1(BaseScrapper):
             List of subjects (countries).
 
         """
-        self._driver.find_element(
-            By.XPATH,
-            '//button[@type="button" and @class="btn btn-outline-secondary btn-calendar" and @onclick="toggleMainCountrySelection();"]',
-        ).click()
-        self._driver.implicitly_wait(0.2)  # wait for the countries to load
-        checked_elements = self._driver.find_element(By.ID, "te-c-all").find_elements(
-            By.XPATH, "//li[input[@checked='']]"
-        )
+        self._driver.find_element(By.CSS_SELECTOR, COUNTRIES_TOGGLE_SELECTOR).click()
+        self._wait_until(EC.visibility_of_element_located((By.ID, "te-c-all")))  # wait for the countries to load
+        checked_elements = self._driver.find_elements(By.CSS_SELECTOR, 'li:has(> input[checked=""])')
         checked_countries = [element.text for element in checked_elements]
-        self._driver.find_element(
-            By.XPATH,
-            '//button[@type="button" and @class="btn btn-outline-secondary btn-calendar" and @onclick="toggleMainCountrySelection();"]',
-        ).click()
+        self._driver.find_element(By.CSS_SELECTOR, COUNTRIES_TOGGLE_SELECTOR).click()
         return checked_countries
 
     def _validate_current_filters(self) -> None:
@@ -233,7 +300,7 @@ class EconomicEventsScrapperV1(BaseScrapper):
         if current_timezone != "0":
             raise DifferentTimezoneException(f"Timezone is set to {current_timezone}, but should be set to: 0 (UTC).")
 
-        if Counter(current_subjects) != Counter(subjects_names):
+        if Counter(current_subjects) != subjects_names_count:
             raise DifferentSubjectException(
                 f"Current subjects filter is set to {current_subjects}, but should be set to {subjects_names}."
             )
@@ -265,11 +332,10 @@ class EconomicEventsScrapperV1(BaseScrapper):
         label = "Recent" if self._fresh_filters else "Custom"
         self._date_from, self._date_to = from_date, to_date
         self._driver.find_element(By.XPATH, f"//span[contains(text(), '{label}')]").click()
-        self._driver.implicitly_wait(0.2)  # wait for the form to load
-        self._driver.find_element(By.XPATH, "//i[@class='bi bi-pencil']/parent::*").click()
+        self._wait_until(EC.element_to_be_clickable((By.CSS_SELECTOR, ":has(> i.bi.bi-pencil)"))).click()
 
-        start_date_input = self._driver.find_element(By.XPATH, "//input[@id='startDate']")
-        end_date_input = self._driver.find_element(By.XPATH, "//input[@id='endDate']")
+        start_date_input = self._wait_until(EC.element_to_be_clickable((By.ID, "startDate")))
+        end_date_input = self._driver.find_element(By.ID, "endDate")
 
         start_date_input.clear()
         start_date_input.send_keys(from_date.strftime("%Y-%m-%d"))
@@ -286,28 +352,13 @@ class EconomicEventsScrapperV1(BaseScrapper):
         Change the countries filter.
 
         """
-        self._driver.find_element(
-            By.XPATH,
-            '//button[@type="button" and @class="btn btn-outline-secondary btn-calendar" and @onclick="toggleMainCountrySelection();"]',
+        self._driver.find_element(By.CSS_SELECTOR, COUNTRIES_TOGGLE_SELECTOR).click()
+        self._wait_until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, 'a.te-c-option[onclick="clearSelection();"]'))
         ).click()
-        self._driver.implicitly_wait(0.2)
-        self._driver.find_element(
-            By.XPATH,
-            '//a[@class="btn btn-outline-secondary te-c-option" and @onclick="clearSelection();"]',
-        ).click()
-        self._driver.implicitly_wait(0.2)
-
-        countries_element = self._driver.find_element(By.ID, "te-c-all")
-
-        random.shuffle(subjects_names)
-        for name in subjects_names:
-            if element := countries_element.find_element(By.XPATH, f"//a[@noref='' and text()='{name}']"):
-                if not self._gui:
-                    ActionChains(self._driver).move_to_element(element).perform()
-
-                element.click()
-
-        countries_element.find_element(By.XPATH, "//a[@onclick='saveSelectionAndGO();']").click()
+        self._wait_until(EC.visibility_of_element_located((By.ID, "te-c-all")))  # wait for the countries to load
+        self._driver.execute_script(SELECT_COUNTRIES_SCRIPT, subjects_names)
+        self._driver.find_element(By.CSS_SELECTOR, 'a[onclick="saveSelectionAndGO();"]').click()
 
 
 DEFAULT_SCRAPPER_CLASS = EconomicEventsScrapperV1
@@ -1,25 +1,47 @@
 import logging
-
-from fmp.errors import BaseMessageException
+from typing import Optional
 
 scraper_logger = logging.getLogger("scraper_logger")
 
 
-class ScrapperException(BaseMessageException):
+class MessageException(Exception):
+    """
+    Base exception class for displaying messages, optionally logged on creation.
+
+    Used instead of fmp.errors.BaseMessageException, whose name-mangled default message never reaches subclasses.
+    The exceptions of fmp-core, like NoProxyLoadedException, don't derive from it.
+
+    Attributes
+    ----------
+    default_message : Optional[str]
+        Message used when none is given, subclasses override it.
+    """
+
+    default_message: Optional[str] = None
+
+    def __init__(self, message: Optional[str] = None, logger: Optional[logging.Logger] = None) -> None:
+        self.message = message or self.default_message
+        super().__init__(self.message)
+
+        if logger:
+            logger.error(self.message)
+
+
+class ScrapperException(MessageException):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(logger=scraper_logger, *args, **kwargs)
 
 
-class YahooTickerObjectNotDefinedException(BaseMessageException):
+class YahooTickerObjectNotDefinedException(MessageException):
     """Exception raised when a Yahoo ticker object is not defined."""
 
-    __message = "Yahoo ticker object not defined."
+    default_message = "Yahoo ticker object not defined."
 
 
-class ClientUpdateTypeNotDefinedException(BaseMessageException):
+class ClientUpdateTypeNotDefinedException(MessageException):
     """Exception raised when a client update type is not defined."""
 
-    __message = "Client update type not defined."
+    default_message = "Client update type not defined."
 
 
 class ScrapperUrlNotDefinedException(ScrapperException): ...
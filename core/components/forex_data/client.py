@@ -1,12 +1,14 @@
+import asyncio
 import logging
 from abc import abstractmethod
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Type
 
 import pandas as pd
 import yfinance as yf
-from fmp.repository.models import ForexPair, ForexTickerList
+from fmp.repository.models import ForexPair, ForexTicker, ForexTickerList
 from fmp.repository.utils import handle_insert_error
 from pandas import DataFrame
 from pymongo.errors import BulkWriteError
@@ -14,20 +16,73 @@ from pymongo.errors import BulkWriteError
 from core.components.client import FMPClient
 from core.components.errors import ClientUpdateTypeNotDefinedException, YahooTickerObjectNotDefinedException
 from core.components.forex_data.crawler import ForexDataCSVCrawler
+from core.components.forex_data.repository import ForexDataRepository
 from core.components.forex_data.scrapper import ForexCSVDataScrapper
-from core.config import cfg
+from core.config import get_cfg
 from core.consts import ForexUpdateType, Interval, Period
 
 __all__ = ["DefaultForexDataClient"]
 
 logger = logging.getLogger("forex_data_logger")
 
+INSERT_CHUNK_SIZE = 1000
+LATEST_UPDATE_INTERVAL = timedelta(minutes=5)  # matches the interval of the latest data, no newer bar before that
+
 COLUMNS_HISTORICAL = ["Ticker", "Date", "Open", "High", "Low", "Close"]
 COLUMNS_LATEST = ["Ticker", "Datetime", "Open", "High", "Low", "Close"]
+COLUMNS_CSV = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
+CSV_PRICE_DTYPES = {"Open": "float64", "High": "float64", "Low": "float64", "Close": "float64"}
+FOREX_CSV_TICKERS = (
+    "EURUSD",
+    "GBPUSD",
+    "USDCAD",
+    "USDCHF",
+    "USDJPY",
+    "AUDCAD",
+    "AUDCHF",
+    "AUDJPY",
+    "AUDUSD",
+    "CADCHF",
+    "CADJPY",
+    "CHFJPY",
+    "EURAUD",
+    "EURCAD",
+    "EURCHF",
+    "EURGBP",
+    "EURJPY",
+    "GBPAUD",
+    "GBPCAD",
+    "GBPCHF",
+    "GBPJPY",
+)
+
+
+@lru_cache(maxsize=512)  # fits all the configured pairs, a smaller cache is cycled through by every full update
+def forex_pair_from_raw(raw_ticker: str) -> ForexPair:
+    """
+    Memoised ForexPair.from_raw, there are only a few hundred distinct tickers.
+    The returned pair is shared between the callers and must not be modified.
+
+    Parameters
+    ----------
+    raw_ticker : str
+        Raw ticker, like 'EURUSD'.
+
+    Returns
+    -------
+    ForexPair
+        Forex pair object.
+
+    """
+    return ForexPair.from_raw(raw_ticker)
 
 
 class ForexDataClient(FMPClient):
-    @property
+    def __init__(self, repository: Type[ForexDataRepository]) -> None:
+        super().__init__(repository)
+        self._repository: ForexDataRepository
+
+    @cached_property
     def tickers(self) -> list[ForexPair]:
         """
         Cached property of all available Forex tickers.
@@ -38,9 +93,9 @@ class ForexDataClient(FMPClient):
             List of ForexPair objects.
 
         """
-        return ForexPair.parse_list(cfg.fmp.consts.default_forex_pairs)
+        return [forex_pair_from_raw(raw_ticker) for raw_ticker in get_cfg().fmp.consts.default_forex_pairs]
 
-    async def _save(self, forex_tickers_list: ForexTickerList) -> None:
+    async def _save(self, forex_tickers_list: ForexTickerList, fast_insert: bool = False) -> None:
         """
         Update the database with a list of ForexTicker objects.
 
@@ -48,19 +103,52 @@ class ForexDataClient(FMPClient):
         ----------
         forex_tickers_list : ForexTickerList
             List of ForexTicker objects.
+        fast_insert : bool
+            Insert without waiting for the acknowledgement, for the historical backfills.
 
         """
-        await self._repository.ensure_indexes()
+        await self._ensure_indexes()
+        documents: list[dict] = self._to_documents(forex_tickers_list)
 
-        if len(forex_tickers_list) > 10000:
-            for chunk in [forex_tickers_list[i : i + 10000] for i in range(0, len(forex_tickers_list), 10000)]:
-                await self._save_chunk(ForexTickerList.model_validate(chunk))
-        else:
-            await self._save_chunk(forex_tickers_list)
+        await self._write_chunks(partial(self._save_chunk, fast_insert=fast_insert), documents, INSERT_CHUNK_SIZE)
+
+    @staticmethod
+    def _to_documents(forex_tickers_list: ForexTickerList) -> list[dict]:
+        """
+        Build the database documents straight from the model attributes, the same ones model_dump() would produce,
+        without going through the pydantic serializer for every row.
+
+        Parameters
+        ----------
+        forex_tickers_list : ForexTickerList
+            List of ForexTicker objects.
+
+        Returns
+        -------
+        list[dict]
+            Documents to insert.
 
-    async def _save_chunk(self, documents: ForexTickerList) -> None:
+        """
+        documents = []
+
+        for forex_ticker in forex_tickers_list.root:  # the plain list, skips the ListBaseModel iterator
+            documents.append(
+                {
+                    "ticker": forex_ticker.ticker.raw,
+                    "timestamp": forex_ticker.timestamp,
+                    "close": forex_ticker.close,
+                    "high": forex_ticker.high,
+                    "low": forex_ticker.low,
+                    "open": forex_ticker.open,
+                }
+            )
+
+        return documents
+
+    async def _save_chunk(self, documents: list[dict], fast_insert: bool) -> None:
         try:
-            await self._repository.insert_many(documents.model_dump(), ordered=False)
+            repository = self._repository.unacknowledged if fast_insert else self._repository
+            await repository.insert_many(documents, ordered=False)
         except BulkWriteError as e:
             handle_insert_error(e)
 
@@ -79,7 +167,34 @@ class ForexDataClient(FMPClient):
             List of ForexTicker objects.
 
         """
-        return ForexTickerList.model_validate(data.to_dict(orient="records"))
+        # the columns come typed from pandas, so the models are constructed without the per-row validation,
+        # the timestamps are set the way ForexTicker validates them: a daily Date gets the configured timezone,
+        # an intraday Datetime is already timezone-aware and kept as it is
+        if "Date" in data.columns:
+            dates = pd.DatetimeIndex(data["Date"])
+
+            if dates.tz is not None:  # keep the wall time, like replace(tzinfo=...)
+                dates = dates.tz_localize(None)
+
+            timestamps = dates.tz_localize(get_cfg().timezone).to_pydatetime()
+        else:
+            timestamps = pd.DatetimeIndex(data["Datetime"]).to_pydatetime()
+
+        construct = ForexTicker.model_construct
+
+        return ForexTickerList.model_construct(
+            [
+                construct(ticker=ticker, timestamp=timestamp, close=close, high=high, low=low, open=open_)
+                for ticker, timestamp, close, high, low, open_ in zip(
+                    data["Ticker"].tolist(),
+                    timestamps,
+                    data["Close"].tolist(),
+                    data["High"].tolist(),
+                    data["Low"].tolist(),
+                    data["Open"].tolist(),
+                )
+            ]
+        )
 
     @abstractmethod
     def _download(self, *args, **kwargs):
@@ -101,14 +216,17 @@ class ForexDataClient(FMPClient):
 class YahooFinanceDataClient(ForexDataClient):
     def __init__(self, *args, **kwargs):
         self._yf: Optional[yf.Ticker | yf.Tickers] = None
+        self._yf_tickers: list[ForexPair] = []
         self._update_state: Optional[ForexUpdateType] = None
         super().__init__(*args, **kwargs)
 
     def for_single_ticker(self, ticker: ForexPair) -> None:
         self._yf = yf.Ticker(ticker.yf)
+        self._yf_tickers = [ticker]
 
     def for_multiple_tickers(self, tickers: list[ForexPair]) -> None:
         self._yf = yf.Tickers([ticker.yf for ticker in tickers])
+        self._yf_tickers = list(tickers)
 
     async def update_historical(self):
         self._update_state = ForexUpdateType.HISTORICAL
@@ -116,7 +234,49 @@ class YahooFinanceDataClient(ForexDataClient):
 
     async def update_latest(self):
         self._update_state = ForexUpdateType.LATEST
-        await self._update(interval=Interval.FIVE_MINUTES.value, period=Period.MAX.value)
+
+        if not self._yf:
+            raise YahooTickerObjectNotDefinedException
+
+        outdated_tickers = await self._outdated_tickers()
+
+        if not outdated_tickers:
+            logger.info("All the tickers are up to date, nothing to download.")
+            return
+
+        yf_tickers = None
+
+        if len(outdated_tickers) < len(self._yf_tickers):  # one-off download, the client keeps all its tickers
+            logger.info(f"Updating {len(outdated_tickers)} out of {len(self._yf_tickers)} tickers.")
+            yf_tickers = yf.Tickers([ticker.yf for ticker in outdated_tickers])
+
+        await self._update(interval=Interval.FIVE_MINUTES.value, period=Period.MAX.value, yf_tickers=yf_tickers)
+
+    async def _outdated_tickers(self) -> list[ForexPair]:
+        """
+        Filter out the tickers updated within the last LATEST_UPDATE_INTERVAL,
+        the latest timestamps of all the tickers are fetched in a single query.
+
+        Returns
+        -------
+        list[ForexPair]
+            Tickers to update.
+
+        """
+        latest_timestamps = await self._repository.get_latest_timestamps(self._yf_tickers)
+        threshold = datetime.now(UTC) - LATEST_UPDATE_INTERVAL
+        outdated_tickers = []
+
+        for ticker in self._yf_tickers:
+            timestamp = latest_timestamps.get(ticker.raw)
+
+            if timestamp is not None and timestamp.tzinfo is None:  # stored in UTC, returned naive by the driver
+                timestamp = timestamp.replace(tzinfo=UTC)
+
+            if timestamp is None or timestamp < threshold:
+                outdated_tickers.append(ticker)
+
+        return outdated_tickers
 
     @property
     def columns(self):
@@ -142,7 +302,8 @@ class YahooFinanceDataClient(ForexDataClient):
         if not self._yf:
             raise YahooTickerObjectNotDefinedException
 
-        yahoo_df: DataFrame = self._download(**kwargs)
+        # yfinance fetches the symbols on its own threads, the blocking call is kept off the event loop
+        yahoo_df: DataFrame = await asyncio.to_thread(self._download, **kwargs)
 
         if yahoo_df.empty:
             logger.error("Failed to download data. Aborting.")
@@ -153,11 +314,12 @@ class YahooFinanceDataClient(ForexDataClient):
         forex_data: ForexTickerList = self._parse(yahoo_df)
         logger.info(f"Parsed {len(forex_data)} tickers out of downloaded data.")
 
-        await self._save(forex_data)
+        # historical bars don't change, they are inserted without waiting for the acknowledgement
+        await self._save(forex_data, fast_insert=self._update_state == ForexUpdateType.HISTORICAL)
         logger.info("Saved new data to the database.")
 
-    def _download(self, *args, **kwargs):
-        return self._yf.history(*args, **kwargs)
+    def _download(self, *args, yf_tickers: Optional[yf.Tickers] = None, **kwargs):
+        return (self._yf if yf_tickers is None else yf_tickers).history(*args, **kwargs)
 
     def _parse(self, data: DataFrame, *args, **kwargs) -> ForexTickerList:  # noqa
         """
@@ -180,7 +342,9 @@ class YahooFinanceDataClient(ForexDataClient):
         data = data.stack(level=1, future_stack=True).reset_index()
         data = data.dropna(subset=["Close", "Open", "High", "Low"])
         data = data[self.columns]
-        data["Ticker"] = data["Ticker"].str.replace("=X", "").apply(ForexPair.from_raw)
+        raw_tickers = data["Ticker"].str.replace("=X", "")
+        forex_pairs = {raw_ticker: forex_pair_from_raw(raw_ticker) for raw_ticker in raw_tickers.unique()}
+        data["Ticker"] = raw_tickers.map(forex_pairs)
 
         return super()._parse(data)
 
@@ -198,47 +362,48 @@ class ForexDataCSVClient(ForexDataClient):
     def update_latest(self, *args, **kwargs) -> None:
         pass
 
+    @staticmethod
+    def _read_csv(file_name: Path) -> DataFrame:
+        """
+        Read a downloaded CSV file into a typed dataframe.
+
+        Parameters
+        ----------
+        file_name : Path
+            Path to the CSV file.
+
+        Returns
+        -------
+        DataFrame
+            Dataframe with the Datetime, Open, High, Low and Close columns.
+
+        """
+        data = pd.read_csv(file_name, names=COLUMNS_CSV, usecols=COLUMNS_CSV[:-1], dtype=CSV_PRICE_DTYPES, engine="c")
+        data["Datetime"] = pd.to_datetime(data["Datetime"], utc=True)
+        return data
+
     async def update_all(self, *args, **kwargs) -> None:
-        for file_name in Path(cfg.project_path.forex_csv_directory).iterdir():
-            ticker_df = None
-            if file_name.is_file() and file_name.suffix == ".csv":
-                ticker = file_name.name.split("_")[0]
-                data = pd.read_csv(file_name, names=["Datetime", "Open", "High", "Low", "Close", "Volume"])
-                data["Datetime"] = pd.to_datetime(data["Datetime"], utc=True)
-                data["Ticker"] = ForexPair.from_raw(ticker)
-                logger.info(f"Loaded {len(data)} rows from {file_name}.")
+        file_names = [
+            file_name
+            for file_name in Path(get_cfg().project_path.forex_csv_directory).iterdir()
+            if file_name.is_file() and file_name.suffix == ".csv"
+        ]
+        frames = await asyncio.gather(*[asyncio.to_thread(self._read_csv, file_name) for file_name in file_names])
+
+        for file_name, data in zip(file_names, frames):
+            ticker = file_name.name.split("_")[0]
+            data["Ticker"] = forex_pair_from_raw(ticker)
+            logger.info(f"Loaded {len(data)} rows from {file_name}.")
 
-                forex_data = self._parse(data)
-                logger.info(f"Parsed {len(forex_data)} rows for {ticker}.")
+            forex_data = self._parse(data)
+            logger.info(f"Parsed {len(forex_data)} rows for {ticker}.")
 
-                await self._save(forex_data)
-                logger.info("Saved new data to the database.")
+            await self._save(forex_data, fast_insert=True)  # historical data exported by the source
+            logger.info("Saved new data to the database.")
 
     @property
-    def tickers(self) -> list[str]:
-        return [
-            "EURUSD",
-            "GBPUSD",
-            "USDCAD",
-            "USDCHF",
-            "USDJPY",
-            "AUDCAD",
-            "AUDCHF",
-            "AUDJPY",
-            "AUDUSD",
-            "CADCHF",
-            "CADJPY",
-            "CHFJPY",
-            "EURAUD",
-            "EURCAD",
-            "EURCHF",
-            "EURGBP",
-            "EURJPY",
-            "GBPAUD",
-            "GBPCAD",
-            "GBPCHF",
-            "GBPJPY",
-        ]
+    def tickers(self) -> tuple[str, ...]:
+        return FOREX_CSV_TICKERS
 
     def download_files(
         self,
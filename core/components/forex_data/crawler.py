@@ -1,48 +1,106 @@
 import logging
+import multiprocessing
+import os
 import random
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 from core.components.crawler import BaseCrawler
 from core.components.errors import TickerNotAvailableException
+from core.components.scrapper import BaseScrapper, browser_pool
+from core.components.utils import wait_random
+from core.config import get_cfg
 
 logger = logging.getLogger("forex_data_logger")
 
+WORKER_DELAY_OFFSET = 0.1  # seconds, added per worker index to desynchronise requests against the source site
+
 
 class ForexDataCSVCrawler(BaseCrawler):
-    def __init__(self, tickers: list[str], *args, **kwargs):
+    def __init__(self, tickers: list[str], *args, max_workers: int = 4, **kwargs):
         super().__init__(*args, **kwargs)
-        self._tickers = tickers
+        self._tickers = list(tickers)
         self._original_tickers_count = len(tickers)
+        self._max_workers = max_workers
 
     def crawl(self, *args, **kwargs) -> None:
-        while self._tickers:
-            tickers_number = random.randint(3, 6)
-            # tickers_to_crawl = self._tickers
-            if len(self._tickers) <= 6:
-                tickers_to_crawl = self._tickers
-                self._remove_tickers(self._tickers)
-            else:
-                tickers_to_crawl = self._cut_tickers_list(tickers_number)
-
-            # with self._scrapper_class(gui=self._gui) as scrapper:
-            with self._scrapper_class() as scrapper:
+        """
+        Download the data for all the tickers, using up to max_workers browsers running in separate processes.
+        Tickers are split round-robin between the workers, each worker reuses its own browser.
+
+        """
+        random.shuffle(self._tickers)
+        workers = min(self._max_workers, len(self._tickers))
+        shards = [self._tickers[i::workers] for i in range(workers)]
+        driver_path = self._scrapper_class.install_driver()  # once, in the parent process
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),  # same behaviour on every platform
+            initializer=self._scrapper_class.use_driver,
+            initargs=(driver_path,),
+        ) as executor:
+            list(executor.map(self._crawl_shard, range(workers), shards))  # re-raises worker errors
+
+        self._tickers.clear()
+
+    def _crawl_shard(self, worker: int, tickers: list[str]) -> None:
+        """
+        Download the data for a shard of tickers with a single browser. Runs in a worker process.
+
+        Each worker downloads into its own sub-directory, so it waits only for its own downloads.
+        Finished files are moved to the forex CSV directory afterward.
+
+        Parameters
+        ----------
+        worker : int
+            Worker index.
+        tickers : list[str]
+            Ticker symbols.
+
+        """
+        forex_csv_directory = get_cfg().project_path.forex_csv_directory
+        download_directory = os.path.join(forex_csv_directory, f".worker-{worker}")
+        os.makedirs(download_directory, exist_ok=True)
+
+        try:
+            time.sleep(worker * WORKER_DELAY_OFFSET)  # offsets the start only, the tickers are paced by wait_random
+
+            with self._scrapper_class(download_directory=download_directory) as scrapper:
                 scrapper.setup()
 
-                for ticker in tickers_to_crawl:
-                    try:
-                        scrapper.get_data(ticker)
-                    except TickerNotAvailableException:
-                        continue
+                for ticker in tickers:
+                    self._crawl_ticker(scrapper, ticker)
+        finally:
+            browser_pool.close()  # worker processes exit without running atexit hooks
+
+            for file_name in os.listdir(download_directory):
+                if not file_name.endswith(".crdownload"):
+                    os.replace(
+                        os.path.join(download_directory, file_name),
+                        os.path.join(forex_csv_directory, file_name),
+                    )
+
+            shutil.rmtree(download_directory)
 
-    def _cut_tickers_list(self, tickers_number: int) -> list[str]:
-        tickers = random.sample(self._tickers, tickers_number)
-        self._remove_tickers(tickers)
-        return tickers
+    @wait_random()
+    def _crawl_ticker(self, scrapper: BaseScrapper, ticker: str) -> None:
+        """
+        Download the data for a single ticker, after a random delay.
 
-    def _remove_tickers(self, tickers: list[str]) -> None:
-        if tickers == self._tickers:
-            self._tickers = []
+        Parameters
+        ----------
+        scrapper : BaseScrapper
+            Prepared scrapper.
+        ticker : str
+            Ticker symbol.
 
-        self._tickers = [date for date in self._tickers if date not in tickers]
+        """
+        try:
+            scrapper.get_data(ticker)
+        except TickerNotAvailableException:
+            pass
 
     @property
     def iteration_done(self) -> bool:
@@ -0,0 +1,60 @@
+import copy
+from datetime import datetime
+from functools import cached_property
+
+from fmp.repository.models import ForexPair
+from fmp.repository.mongo import ForexDataRepository as CoreForexDataRepository
+from pymongo import DESCENDING, WriteConcern
+
+__all__ = ["ForexDataRepository"]
+
+
+class ForexDataRepository(CoreForexDataRepository):
+    """
+    MongoDB repository class for forex data, extended with unacknowledged writes for the backfills.
+
+    Attributes
+    ----------
+    __collection_name : Optional[str]
+        Name of the collection associated with the repository.
+
+    """
+
+    __collection_name = "forex_data"  # name-mangled, must be redefined in each subclass
+
+    @cached_property
+    def unacknowledged(self) -> "ForexDataRepository":
+        """
+        Returns a view of the repository whose writes don't wait for the server acknowledgement (write concern w=0).
+        Any write error, duplicate keys included, goes unreported, so use it only for idempotent historical data.
+
+        Returns
+        -------
+        ForexDataRepository
+            Repository sharing the connection, with an unacknowledged collection.
+        """
+        repository = copy.copy(self)
+        repository._collection = self._collection.with_options(write_concern=WriteConcern(w=0))
+        return repository
+
+    async def get_latest_timestamps(self, tickers: list[ForexPair]) -> dict[str, datetime]:
+        """
+        Get the timestamp of the latest document of each ticker, in a single aggregation.
+
+        Parameters
+        ----------
+        tickers : list[ForexPair]
+            Tickers to look up.
+
+        Returns
+        -------
+        dict[str, datetime]
+            Latest timestamp by raw ticker, tickers without any document are left out.
+        """
+        pipeline = [
+            {"$match": {"ticker": {"$in": [ticker.raw for ticker in tickers]}}},
+            {"$sort": {"ticker": DESCENDING, "timestamp": DESCENDING}},  # follows the unique index
+            {"$group": {"_id": "$ticker", "timestamp": {"$first": "$timestamp"}}},
+        ]
+        documents = await self._collection.aggregate(pipeline).to_list(None)
+        return {document["_id"]: document["timestamp"] for document in documents}
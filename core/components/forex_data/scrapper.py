@@ -1,29 +1,34 @@
 import logging
 import os
 import time
-from time import sleep
+from typing import Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
+from watchfiles import watch
 
 from core.components.errors import ScrapperNotPreparedException, TickerNotAvailableException
 from core.components.scrapper import BaseScrapper
 from core.components.utils import wait_random
-from core.config import cfg
+from core.config import get_cfg
 
 logger = logging.getLogger("scrapper_logger")
 
 
 class ForexCSVDataScrapper(BaseScrapper):
-    source_url: str = str(cfg.fmp.forex_csv_source_url)
+    @property
+    def source_url(self) -> str:
+        return str(get_cfg().fmp.forex_csv_source_url)
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, download_directory: Optional[str] = None, *args, **kwargs):
+        kwargs.setdefault("use_seleniumwire", False)  # requests are never inspected, skip the MITM proxy
         super().__init__(*args, **kwargs)
+        self._download_directory = download_directory or get_cfg().project_path.forex_csv_directory
         self._options.add_experimental_option(
             "prefs",
             {
-                "download.default_directory": cfg.project_path.forex_csv_directory,
+                "download.default_directory": self._download_directory,
                 "download.prompt_for_download": False,
                 "download.directory_upgrade": True,
             },
@@ -43,7 +48,7 @@ class ForexCSVDataScrapper(BaseScrapper):
 
     @wait_random(0.03, 0.5)
     def _change_settings(self):
-        self._driver.find_element(By.XPATH, '//*[@data-panel-switch="settings"]').click()
+        self._driver.find_element(By.CSS_SELECTOR, '[data-panel-switch="settings"]').click()
         time.sleep(0.05)
         tz_el = self._driver.find_element(By.ID, "select-timezone")
         bars_el = self._driver.find_element(By.ID, "select-max-bars")
@@ -57,15 +62,15 @@ class ForexCSVDataScrapper(BaseScrapper):
     def _select_ticker(self, ticker: str):
         self._select_symbol(ticker)
         self._run_loading()
-        self._driver.find_element(By.XPATH, '//*[@data-panel-switch="acquisition"]').click()
+        self._driver.find_element(By.CSS_SELECTOR, '[data-panel-switch="acquisition"]').click()
 
     def _download(self):
         tr_element = self._driver.find_element(By.ID, "table-acquisition").find_elements(By.TAG_NAME, "tr")[3]
         download_element = WebDriverWait(tr_element, 10).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
         self._file_name = tr_element.text
+        existing_files = set(os.listdir(self._download_directory))
         download_element.click()
-        sleep(1)
-        self._wait_for_download()
+        self._wait_for_download(existing_files)
 
     @wait_random(0.03, 0.5)
     def _select_symbol(self, ticker: str):
@@ -88,15 +93,42 @@ class ForexCSVDataScrapper(BaseScrapper):
         self._select_ticker(ticker)
         self._download()
 
-    def _wait_for_download(self, timeout=10):
-        start_time = time.time()
-        file_path = os.path.join(cfg.project_path.forex_csv_directory, self._file_name)
-
-        while time.time() - start_time < timeout:
-            if any(fname.endswith(".crdownload") for fname in os.listdir(cfg.project_path.forex_csv_directory)):
-                time.sleep(1)
-            else:
-                logger.info(f"Successfully downloaded the file: " f"{file_path}.")
+    def _download_finished(self, existing_files: set[str]) -> bool:
+        file_names = os.listdir(self._download_directory)
+        if any(file_name.endswith(".crdownload") for file_name in file_names):
+            return False
+
+        return bool(set(file_names) - existing_files)
+
+    def _wait_for_download(self, existing_files: set[str], timeout: int = 10) -> None:
+        """
+        Wait until the download started by the last click is finished, woken up by filesystem events.
+        The download is finished once a new file appeared in the download directory
+        and no partial (.crdownload) file is left.
+
+        Parameters
+        ----------
+        existing_files : set[str]
+            File names present in the download directory before the download started.
+        timeout : int
+            Maximum time to wait, in seconds.
+
+        Raises
+        ------
+        TimeoutError
+            If the download is not finished within the timeout.
+
+        """
+        deadline = time.monotonic() + timeout
+        file_path = os.path.join(self._download_directory, self._file_name)
+
+        # yield_on_timeout re-checks periodically, in case the download finished before the watcher started
+        for _ in watch(self._download_directory, debounce=50, rust_timeout=500, yield_on_timeout=True):
+            if self._download_finished(existing_files):
+                logger.info(f"Successfully downloaded the file: {file_path}.")
+                return
+
+            if time.monotonic() > deadline:
                 break
-        else:
-            raise TimeoutError(f"Pobieranie trwało zbyt długo: {file_path}")
+
+        raise TimeoutError(f"Pobieranie trwało zbyt długo: {file_path}")
@@ -1,25 +1,133 @@
+import atexit
+import json
 import logging
-import random
+import threading
 from abc import abstractmethod
+from collections import defaultdict
+from typing import ClassVar, Hashable, Optional
 
+from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from seleniumwire import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+from seleniumwire import webdriver as wire_webdriver
 from webdriver_manager.chrome import ChromeDriverManager
 
 from core.components.errors import ScrapperUrlNotDefinedException
-from core.config import cfg
-from core.consts import USER_AGENTS
+from core.config import get_cfg
+from core.consts import BLOCKED_RESOURCE_URLS, next_user_agent
 
 logger = logging.getLogger("scrapper_logger")
 
 
+class BrowserPool:
+    """
+    Pool of idle browsers, reused by scrappers instead of starting a new Chrome for every session.
+
+    Browsers are grouped by key, only a browser started with the same configuration is handed out again.
+    Idle browsers are quit when the process exits. Processes that exit without running atexit hooks
+    (like ProcessPoolExecutor workers) must call close() themselves, and so must long-running processes between
+    the jobs, the CLI commands do it when they end.
+
+    Attributes
+    ----------
+    max_idle : int
+        Maximum number of idle browsers kept per key, the ones over the limit are quit on release.
+
+    """
+
+    def __init__(self, max_idle: int = 4) -> None:
+        self.max_idle = max_idle
+        self._idle: dict[Hashable, list[WebDriver]] = defaultdict(list)
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def acquire(self, key: Hashable) -> Optional[WebDriver]:
+        """
+        Take an idle browser out of the pool.
+
+        Parameters
+        ----------
+        key : Hashable
+            Browser configuration key.
+
+        Returns
+        -------
+        Optional[WebDriver]
+            Idle browser, None if there is none for the key.
+
+        """
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop()
+
+        return None
+
+    def release(self, key: Hashable, driver: WebDriver) -> None:
+        """
+        Reset the browser state and put it back to the pool. Quit it instead if it cannot be reset
+        or the pool is full.
+
+        Parameters
+        ----------
+        key : Hashable
+            Browser configuration key.
+        driver : WebDriver
+            Browser to release.
+
+        """
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})  # all domains, not only the current document
+            driver.get("about:blank")
+        except Exception as e:
+            logger.warning(f"Could not reset the browser, quitting it: {e}")
+            self.discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle[key]) < self.max_idle:
+                self._idle[key].append(driver)
+                return
+
+        self.discard(driver)
+
+    @staticmethod
+    def discard(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Could not quit the browser: {e}")
+
+    def close(self) -> None:
+        """
+        Quit all the idle browsers.
+
+        """
+        with self._lock:
+            drivers = [driver for drivers in self._idle.values() for driver in drivers]
+            self._idle.clear()
+
+        for driver in drivers:
+            self.discard(driver)
+
+
+browser_pool = BrowserPool()
+
+
 class BaseScrapper:
     source_url: str = None
 
-    def __init__(self, gui: bool = False, use_proxy: bool = True) -> None:
+    _driver_path: ClassVar[Optional[str]] = None  # resolved once per process, shared by all the scrappers
+    _driver_path_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, gui: bool = False, use_proxy: bool = True, block_resources: bool = True, use_seleniumwire: bool = True
+    ) -> None:
         self._gui = gui
         self._use_proxy = use_proxy
+        self._use_seleniumwire = use_seleniumwire
+        self._block_resources = block_resources
         self._driver = None
         self._ready = False
 
@@ -32,27 +140,81 @@ class BaseScrapper:
         self._options.add_experimental_option("useAutomationExtension", False)
         self._options.add_argument("--window-size=2560,1440")
 
-        user_agent = random.choice(USER_AGENTS)
-        self._options.add_argument(f"user-agent={user_agent}")
+        self._user_agent = next_user_agent()
+        self._proxy_url = get_cfg().proxy.next_url() if use_proxy else None  # part of the pool key, see _pool_key
+        self._options.add_argument(f"user-agent={self._user_agent}")
 
         if not gui:
             self._options.add_argument("--headless=now")
             self._options.add_argument("--disable-gpu")
 
+    @classmethod
+    def install_driver(cls) -> str:
+        """
+        Resolve the ChromeDriver path on the first call only. The configured chromedriver_path is used if set,
+        otherwise the driver is installed with webdriver-manager.
+        Call it once before starting worker processes and hand the path to them with use_driver().
+
+        Returns
+        -------
+        str
+            Path to the ChromeDriver executable.
+
+        """
+        with BaseScrapper._driver_path_lock:
+            if BaseScrapper._driver_path is None:
+                if chromedriver_path := get_cfg().chromedriver_path:
+                    BaseScrapper._driver_path = chromedriver_path
+                    logger.info(f"Using configured ChromeDriver: {chromedriver_path}.")
+                else:
+                    BaseScrapper._driver_path = ChromeDriverManager().install()
+                    logger.info(f"Using ChromeDriver installed by webdriver-manager: {BaseScrapper._driver_path}.")
+
+        return BaseScrapper._driver_path
+
+    @classmethod
+    def use_driver(cls, driver_path: str) -> None:
+        """
+        Use a ChromeDriver resolved by another process, like the parent of a worker process.
+        Meant as a process pool initializer, the workers don't share memory with the parent under every start method.
+
+        Parameters
+        ----------
+        driver_path : str
+            Path to the ChromeDriver executable.
+
+        """
+        with BaseScrapper._driver_path_lock:
+            BaseScrapper._driver_path = driver_path
+
+    @classmethod
+    def _get_service(cls) -> Service:
+        return Service(cls.install_driver())
+
     def shutdown(self) -> None:
         self._driver.quit()
 
     def _setup_driver(self):
-        params = {
-            "options": self._options,
-            "service": Service(ChromeDriverManager().install()),
-            "seleniumwire_options": {},
-        }
+        proxy_url = self._proxy_url
 
-        if self._use_proxy:
-            params["seleniumwire_options"]["proxy"] = cfg.proxy.seleniumwire_proxy
+        # Chrome cannot authenticate against a proxy passed with --proxy-server, seleniumwire is needed for that
+        if self._use_seleniumwire or (proxy_url and "@" in proxy_url):
+            params = {
+                "options": self._options,
+                "service": self._get_service(),
+                "seleniumwire_options": {},
+            }
+
+            if proxy_url:
+                params["seleniumwire_options"]["proxy"] = {"http": proxy_url, "https": proxy_url}
+
+            self._driver = wire_webdriver.Chrome(**params)
+        else:
+            if proxy_url:
+                self._options.add_argument(f"--proxy-server={proxy_url}")
+
+            self._driver = webdriver.Chrome(options=self._options, service=self._get_service())
 
-        self._driver = webdriver.Chrome(**params)
         self._driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
             {
@@ -61,15 +223,47 @@ class BaseScrapper:
         """
             },
         )
+
+        if self._block_resources:
+            self._driver.execute_cdp_cmd("Network.enable", {})
+            self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+
         self._driver.get(self.source_url)
 
+    @property
+    def _pool_key(self) -> tuple:
+        """
+        Key of the browser configuration, the user agent is left out on purpose so browsers can be shared.
+        The proxy cannot be changed in a running browser, so only browsers started with the same proxy are shared.
+
+        Returns
+        -------
+        tuple
+            Hashable browser configuration.
+
+        """
+        prefs = json.dumps(self._options.experimental_options.get("prefs", {}), sort_keys=True)
+        return self.__class__, self._gui, self._proxy_url, self._use_seleniumwire, self._block_resources, prefs
+
     def __enter__(self):
-        self._setup_driver()
+        if driver := browser_pool.acquire(self._pool_key):
+            self._driver = driver
+            # the browser was started with another scrapper's user agent, keep the rotation going
+            self._driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": self._user_agent})
+            self._driver.get(self.source_url)
+        else:
+            self._setup_driver()
+
         self._driver.implicitly_wait(5)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.shutdown()
+        if exc_type:  # browser state is unknown, don't reuse it
+            self.shutdown()
+        else:
+            browser_pool.release(self._pool_key, self._driver)
+
+        self._driver = None
 
         if exc_type:
             logger.error(f"Exception occurred: {exc_val}\n{exc_tb}")
@@ -1,11 +1,52 @@
+import asyncio
 import functools
+import inspect
 import random
 import time
 
 
+def _remaining_wait(args: tuple, min_seconds: float, max_seconds: float) -> float:
+    """
+    Draw the random delay and subtract the time already passed since the instance's last decorated action.
+
+    Parameters
+    ----------
+    args : tuple
+        Positional arguments of the decorated call, the instance is expected first.
+    min_seconds : float
+        Minimum time between actions.
+    max_seconds : float
+        Maximum time between actions.
+
+    Returns
+    -------
+    float
+        Time left to wait, in seconds.
+
+    """
+    wait_time = random.uniform(min_seconds, max_seconds)
+    last_action_at = getattr(args[0], "_last_action_at", None) if args else None
+
+    if last_action_at is None:
+        return wait_time
+
+    return max(0.0, wait_time - (time.monotonic() - last_action_at))
+
+
+def _mark_action(args: tuple) -> None:
+    if args:
+        try:
+            args[0]._last_action_at = time.monotonic()
+        except AttributeError:  # not an instance that accepts attributes, no pacing
+            pass
+
+
 def wait_random(min_seconds: float = 0.2, max_seconds: float = 1.0):
     """
-    Decorator to wait a random amount of time after executing the decorated function.
+    Decorator to wait a random amount of time before executing the decorated method.
+    Time already passed since the previous decorated action of the same instance counts towards the wait,
+    so chained actions are paced rather than delayed one after another.
+    Coroutine functions are decorated with wait_random_async, so the event loop is never blocked.
 
     Parameters
     ----------
@@ -17,11 +58,45 @@ def wait_random(min_seconds: float = 0.2, max_seconds: float = 1.0):
     """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            return wait_random_async(min_seconds, max_seconds)(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            wait_time = random.uniform(min_seconds, max_seconds)
-            time.sleep(wait_time)
-            return func(*args, **kwargs)
+            time.sleep(_remaining_wait(args, min_seconds, max_seconds))
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _mark_action(args)
+
+        return wrapper
+
+    return decorator
+
+
+def wait_random_async(min_seconds: float = 0.2, max_seconds: float = 1.0):
+    """
+    Variant of wait_random for coroutines, waits without blocking the event loop.
+
+    Parameters
+    ----------
+    min_seconds : float
+        Minimum time to wait.
+    max_seconds : float
+        Maximum time to wait.
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            await asyncio.sleep(_remaining_wait(args, min_seconds, max_seconds))
+
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _mark_action(args)
 
         return wrapper
 
@@ -8,14 +8,37 @@ It includes configurations for MongoDB, APIs, paths, proxies etc.
 import logging.config
 import os
 import random
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import Optional
 
 from fmp.config import Config as CoreConfig
 from fmp.errors import NoProxyLoadedException
-from pydantic import HttpUrl
+from pydantic import Field, HttpUrl, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=None)
+def _read_lines(file_path: str) -> tuple[str, ...]:
+    """
+    Reads the lines of a text file, once per path. The tuple keeps the cached value immutable.
+    Meant for the defaults read on first access only, explicit reloads must read the file themselves.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file.
+
+    Returns
+    -------
+    tuple[str, ...]
+        Lines of the file.
+    """
+    return tuple(Path(file_path).read_text().splitlines())
+
+
 class FMPConsts:
     """
     FMP constants configuration class.
@@ -23,10 +46,26 @@ class FMPConsts:
     Attributes
     ----------
     default_forex_pairs : list[str]
-        The list of default forex pairs.
+        The list of default forex pairs, read from the forex pairs file on first access.
     """
 
-    default_forex_pairs: list[str] = []
+    def __init__(self, forex_pairs_path: Optional[str] = None) -> None:
+        self._forex_pairs_path = forex_pairs_path
+
+    @cached_property
+    def default_forex_pairs(self) -> list[str]:
+        """
+        Returns the default forex pairs, read from the file on first access.
+
+        Returns
+        -------
+        list[str]
+            List of default forex pairs, empty if no file is set.
+        """
+        if self._forex_pairs_path is None:
+            return []
+
+        return list(_read_lines(self._forex_pairs_path))
 
     def read_default_forex_pairs(self, file_path: str) -> None:
         """
@@ -37,8 +76,7 @@ class FMPConsts:
         file_path : str
             Path to the file (.txt) with default forex pairs.
         """
-        with open(file_path, mode="r") as file:
-            self.default_forex_pairs = file.read().splitlines()
+        self.default_forex_pairs = Path(file_path).read_text().splitlines()  # bypasses the cache, always reloads
 
 
 class FMPConfig(BaseSettings):
@@ -55,12 +93,14 @@ class FMPConfig(BaseSettings):
 
     events_source_url: HttpUrl
     forex_csv_source_url: HttpUrl
-    consts: FMPConsts = FMPConsts()
+    consts: FMPConsts = Field(default_factory=FMPConsts)
 
 
+@dataclass(frozen=True)
 class PathConfig:
     """
-    Paths configuration class.
+    Paths configuration class. The root directory is the working directory at the time the configuration is created,
+    the other paths are derived from it on first access.
 
     Attributes
     ----------
@@ -78,12 +118,27 @@ class PathConfig:
         The directory for forex CSV files.
     """
 
-    root_directory: str = os.getcwd()
-    assets_directory: str = os.path.join(root_directory, "assets")
-    forex_csv_directory: str = os.path.join(assets_directory, "forex_csv")
-    logging_config: str = os.path.join(root_directory, "logging.ini")
-    proxy_list: str = os.path.join(assets_directory, "proxy_list.txt")
-    forex_pairs: str = os.path.join(assets_directory, "forex_pairs.txt")
+    root_directory: str = field(default_factory=os.getcwd)
+
+    @cached_property
+    def assets_directory(self) -> str:
+        return os.path.join(self.root_directory, "assets")
+
+    @cached_property
+    def forex_csv_directory(self) -> str:
+        return os.path.join(self.assets_directory, "forex_csv")
+
+    @cached_property
+    def logging_config(self) -> str:
+        return os.path.join(self.root_directory, "logging.ini")
+
+    @cached_property
+    def proxy_list(self) -> str:
+        return os.path.join(self.assets_directory, "proxy_list.txt")
+
+    @cached_property
+    def forex_pairs(self) -> str:
+        return os.path.join(self.assets_directory, "forex_pairs.txt")
 
 
 class ProxyConfig(BaseSettings):
@@ -93,7 +148,7 @@ class ProxyConfig(BaseSettings):
     Attributes
     ----------
     ip_list : list[str]
-        The list of static proxy IPs.
+        The list of static proxy IPs, read from the proxy list file on first access.
     current : str
         The current proxy IP.
     username : Optional[str]
@@ -108,16 +163,34 @@ class ProxyConfig(BaseSettings):
         Whether to use SSL for the proxy connection.
     """
 
-    ip_list: list[str] = ()
     current: str = ""
 
+    _pool: deque[str] = PrivateAttr(default_factory=deque)  # rotation order, reshuffled after each full cycle
+    _rotations: int = PrivateAttr(default=0)
+    _list_path: Optional[str] = PrivateAttr(default=None)  # set by the application config
+
     username: Optional[str]
     password: Optional[str]
     host: Optional[str]
     port: Optional[str]
     ssl: bool = False
 
-    @property
+    @cached_property
+    def ip_list(self) -> list[str]:
+        """
+        Returns the static proxy IPs, read from the file on first access.
+
+        Returns
+        -------
+        list[str]
+            List of static proxy IPs, empty if no file is set.
+        """
+        if self._list_path is None:
+            return []
+
+        return list(_read_lines(self._list_path))
+
+    @cached_property
     def url(self) -> Optional[str]:
         """
         Returns the proxy URL.
@@ -127,7 +200,7 @@ class ProxyConfig(BaseSettings):
         Optional[str]
             URL to the proxy rotation service.
         """
-        if self.host is None:
+        if not self.host:  # unset or left empty in the .env file
             return None
 
         protocol = "https" if self.ssl else "http"
@@ -138,7 +211,7 @@ class ProxyConfig(BaseSettings):
 
     def shuffle(self) -> Optional[str]:
         """
-        Shuffles the proxy list.
+        Rotates to the next proxy from the shuffled list, each proxy is used once per cycle.
 
         Returns
         -------
@@ -156,14 +229,37 @@ class ProxyConfig(BaseSettings):
         if not self.ip_list:
             raise NoProxyLoadedException("Proxy list is empty.")
 
-        list_copy = list(self.ip_list)
+        if self._rotations == 0:
+            self._pool = deque(random.sample(self.ip_list, len(self.ip_list)))
 
-        if self.current in self.ip_list:
-            list_copy.remove(self.current)
+            if len(self._pool) > 1 and self._pool[0] == self.current:  # don't repeat the proxy between cycles
+                self._pool.rotate(-1)
+        else:
+            self._pool.rotate(-1)
 
-        self.current = random.choice(list_copy)
+        self._rotations = (self._rotations + 1) % len(self._pool)
+        self.current = self._pool[0]
         return self.current
 
+    def next_url(self) -> Optional[str]:
+        """
+        Returns the proxy URL for a new browser. The rotation service URL is preferred, it rotates the IPs by itself,
+        otherwise the next static proxy from the shuffled list is used.
+
+        Returns
+        -------
+        Optional[str]
+            Proxy URL, None if no proxy is configured.
+        """
+        if self.url:
+            return self.url
+
+        if not (address := self.shuffle()):
+            return None
+
+        protocol = "https" if self.ssl else "http"
+        return address if "://" in address else f"{protocol}://{address}"
+
     def read_proxies(self, file_path: str) -> None:
         """
         Reads proxies from the file.
@@ -173,8 +269,9 @@ class ProxyConfig(BaseSettings):
         file_path : str
             Path to the file (.txt) with proxies.
         """
-        with open(file_path, mode="r") as file:
-            self.ip_list = file.read().splitlines()
+        self.ip_list = Path(file_path).read_text().splitlines()  # bypasses the cache, always reloads
+
+        self._rotations = 0  # start a new cycle over the new list
 
     @property
     def available(self) -> bool:
@@ -188,7 +285,7 @@ class ProxyConfig(BaseSettings):
         """
         return bool(self.ip_list)
 
-    @property
+    @cached_property
     def seleniumwire_proxy(self) -> dict:  # noqa
         """
         Returns the proxy configuration for SeleniumWire.
@@ -213,13 +310,16 @@ class Config(CoreConfig):
         Forex defaults/setup configuration.
     proxy : ProxyConfig
         Proxy configuration - dynamic/static.
+    chromedriver_path : Optional[str]
+        Path to a preinstalled ChromeDriver executable, webdriver-manager is used to install one if not set.
     model_config : SettingsConfigDict
         Pydantic model configuration.
     """
 
-    project_path: PathConfig = PathConfig()
+    project_path: PathConfig = Field(default_factory=PathConfig)
     fmp: FMPConfig
     proxy: ProxyConfig
+    chromedriver_path: Optional[str] = None
 
     model_config = SettingsConfigDict(
         env_nested_delimiter="__",
@@ -228,13 +328,24 @@ class Config(CoreConfig):
         extra="allow",
     )
 
-    def model_post_init(self, *args, **kwargs):
+    def model_post_init(self, __context) -> None:
         """
-        Runs after the model initialization.
+        Points the sub-configurations to their files, read on first access.
         """
-        self.fmp.consts.read_default_forex_pairs(self.project_path.forex_pairs)
-        self.proxy.read_proxies(self.project_path.proxy_list)
+        self.fmp.consts = FMPConsts(self.project_path.forex_pairs)
+        self.proxy._list_path = self.project_path.proxy_list
 
 
-cfg = Config()  # noqa
-logging.config.fileConfig(cfg.project_path.logging_config)
+@lru_cache(maxsize=1)
+def get_cfg() -> Config:
+    """
+    Returns the application configuration, created (and logging configured) on the first call.
+
+    Returns
+    -------
+    Config
+        Application configuration.
+    """
+    config = Config()  # noqa
+    logging.config.fileConfig(config.project_path.logging_config)
+    return config